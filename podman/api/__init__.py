@@ -3,10 +3,11 @@
 from podman.api.cached_property import cached_property
 from podman.api.client import APIClient
 from podman.api.api_versions import VERSION, COMPATIBLE_VERSION
-from podman.api.http_utils import prepare_body, prepare_filters
+from podman.api.http_utils import prepare_body, prepare_filters, quote_name
 from podman.api.parse_utils import (
     decode_header,
     frames,
+    json_loads,
     parse_repository,
     prepare_cidr,
     prepare_timestamp,
@@ -16,6 +17,11 @@ from podman.api.parse_utils import (
 from podman.api.tar_utils import create_tar, prepare_containerfile, prepare_containerignore
 
 DEFAULT_CHUNK_SIZE = 2 * 1024 * 1024
+HTTP_NO_CONTENT = 204
+HTTP_NOT_FOUND = 404
+HTTP_NOT_MODIFIED = 304
+JSON_HEADERS = {"Content-Type": "application/json"}
+TAR_HEADERS = {"Content-Type": "application/x-tar"}
 
 try:
     from typing import Literal
@@ -30,12 +36,18 @@ __all__ = [
     'APIClient',
     'COMPATIBLE_VERSION',
     'DEFAULT_CHUNK_SIZE',
+    'HTTP_NOT_FOUND',
+    'HTTP_NOT_MODIFIED',
+    'HTTP_NO_CONTENT',
+    'JSON_HEADERS',
     'Literal',
+    'TAR_HEADERS',
     'VERSION',
     'cached_property',
     'create_tar',
     'decode_header',
     'frames',
+    'json_loads',
     'parse_repository',
     'prepare_body',
     'prepare_cidr',
@@ -43,6 +55,7 @@ __all__ = [
     'prepare_containerignore',
     'prepare_filters',
     'prepare_timestamp',
+    'quote_name',
     'stream_frames',
     'stream_helper',
 ]
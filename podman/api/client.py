@@ -1,14 +1,16 @@
 """APIClient for connecting to Podman service."""
 
-import json
+import re
 import warnings
 import urllib.parse
-from typing import Any, ClassVar, IO, Iterable, List, Mapping, Optional, Tuple, Type, Union
+from typing import Any, ClassVar, Dict, IO, Iterable, List, Mapping, Optional, Tuple, Type, Union
 
 import requests
 from requests.adapters import HTTPAdapter
 
 from podman.api.api_versions import VERSION, COMPATIBLE_VERSION
+from podman.api.cached_property import cached_property
+from podman.api.parse_utils import json_loads
 from podman.api.ssh import SSHAdapter
 from podman.api.uds import UDSAdapter
 from podman.errors import APIError, NotFound
@@ -28,6 +30,9 @@ _Data = Union[
 _Timeout = Union[None, float, Tuple[float, float], Tuple[float, None]]
 """Type alias for request timeout parameter."""
 
+_PLAIN_PATH = re.compile(r"[\w\-.~%@,=+/]*")
+"""Paths that urljoin() would append to the prefix unchanged."""
+
 
 class ParameterDeprecationWarning(DeprecationWarning):
     """
@@ -46,6 +51,9 @@ class APIResponse:
     All other methods and attributes forwarded to original Response.
     """
 
+    # One proxy is created per request, slots avoid allocating a __dict__ for each of them.
+    __slots__ = ("_response",)
+
     def __init__(self, response: requests.Response):
         """Initialize APIResponse.
 
@@ -58,19 +66,46 @@ class APIResponse:
         """Forward any query for an attribute not defined in this proxy class to wrapped class."""
         return getattr(self._response, item)
 
+    def json(self, **kwargs) -> Any:
+        """Returns the decoded JSON body, using orjson when it is installed.
+
+        Keyword Args:
+            Passed to requests.Response.json(), which then performs the decoding.
+        """
+        if kwargs:
+            return self._response.json(**kwargs)
+
+        try:
+            return json_loads(self._response.content)
+        except ValueError:
+            # Defer to requests for encoding detection and its JSONDecodeError
+            return self._response.json()
+
+    @property
+    def ok(self) -> bool:  # pylint: disable=invalid-name
+        """bool: Returns True unless the status code reports a client or server error.
+
+        requests.Response.ok raises and catches an HTTPError to reach the same answer,
+        which is costly on the not found path of exists() probes.
+        """
+        return not 400 <= self._response.status_code < 600
+
     def raise_for_status(self, not_found: Type[APIError] = NotFound) -> None:
         """Raises exception when Podman service reports one."""
-        if self.status_code < 400:
+        # Read once from the wrapped Response rather than forwarding through __getattr__ each time
+        status_code = self._response.status_code
+        if status_code < 400:
             return
 
+        # Error bodies are already buffered, parse them once without the requests fallback
         try:
-            body = self.json()
+            body = json_loads(self._response.content)
             cause = body["cause"]
             message = body["message"]
-        except (json.decoder.JSONDecodeError, KeyError):
-            cause = message = self.text
+        except (ValueError, KeyError):
+            cause = message = self._response.text
 
-        if self.status_code == requests.codes.not_found:
+        if status_code == requests.codes.not_found:
             raise not_found(cause, response=self._response, explanation=message)
         raise APIError(cause, response=self._response, explanation=message)
 
@@ -126,6 +161,10 @@ class APIClient(requests.Session):
         """
         super().__init__()
         self.base_url = self._normalize_url(base_url)
+        # params, query and fragment of base_url are appended to every request URL
+        self._url_suffix = urllib.parse.urlunparse(
+            ("", "", "", self.base_url.params, self.base_url.query, self.base_url.fragment)
+        )
 
         adapter_kwargs = kwargs.copy()
 
@@ -172,6 +211,30 @@ class APIClient(requests.Session):
         )
         self.headers.update({"User-Agent": self.user_agent})
 
+    @cached_property
+    def server_version(self) -> Dict[str, Any]:
+        """Dict[str, Any]: Version report from the Podman service, requested once per client.
+
+        Raises:
+            APIError: when service returns an error
+        """
+        response = self.get("/version")
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _join_path(path_prefix: str, path: str) -> str:
+        """Returns path appended to path_prefix, as urljoin() would.
+
+        Plain paths are concatenated directly; anything urljoin() might rewrite (empty or
+        dot segments, params, query, fragment or scheme-like characters) goes through it.
+        """
+        if _PLAIN_PATH.fullmatch(path) and "//" not in path:
+            segments = f"/{path}/"
+            if "/./" not in segments and "/../" not in segments:
+                return path_prefix + path
+        return urllib.parse.urljoin(path_prefix, path)
+
     @staticmethod
     def _normalize_url(base_url: str) -> urllib.parse.ParseResult:
         uri = urllib.parse.urlparse(base_url)
@@ -419,20 +482,14 @@ class APIClient(requests.Session):
 
         scheme = "https" if kwargs.get("verify", None) else "http"
         # Build URL for operation from base_url
-        uri = urllib.parse.ParseResult(
-            scheme,
-            self.base_url.netloc,
-            urllib.parse.urljoin(path_prefix, path),
-            self.base_url.params,
-            self.base_url.query,
-            self.base_url.fragment,
-        )
+        joined = self._join_path(path_prefix, path)
+        uri = f"{scheme}://{self.base_url.netloc}{joined}{self._url_suffix}"
 
         try:
             return APIResponse(
                 self.request(
                     method.upper(),
-                    uri.geturl(),
+                    uri,
                     params=params,
                     data=data,
                     headers=(headers or {}),
@@ -442,4 +499,4 @@ class APIClient(requests.Session):
                 )
             )
         except OSError as e:
-            raise APIError(uri.geturl(), explanation=f"{method.upper()} operation failed") from e
+            raise APIError(uri, explanation=f"{method.upper()} operation failed") from e
@@ -2,7 +2,9 @@
 
 import base64
 import collections.abc
+import functools
 import json
+import urllib.parse
 from typing import Dict, List, Mapping, Optional, Union, Any
 
 
@@ -99,5 +101,14 @@ def _filter_values(mapping: Mapping[str, Any], recursion=False) -> Dict[str, Any
     return canonical
 
 
+@functools.lru_cache(maxsize=1024)
+def quote_name(name: str) -> str:
+    """Returns name URL quoted for use as a path parameter.
+
+    Results are cached as the same resources are often queried repeatedly.
+    """
+    return urllib.parse.quote_plus(name)
+
+
 def encode_auth_header(auth_config: Dict[str, str]) -> str:
     return base64.urlsafe_b64encode(json.dumps(auth_config).encode('utf-8'))
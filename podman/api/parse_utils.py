@@ -10,6 +10,12 @@ from typing import Any, Dict, Iterator, Optional, Tuple, Union
 from requests import Response
 from .output_utils import demux_output
 
+# orjson (the json extra) is an optional C accelerated decoder, accepting bytes or str
+try:
+    from orjson import loads as json_loads
+except (ImportError, ModuleNotFoundError):
+    from json import loads as json_loads  # pylint: disable=ungrouped-imports
+
 
 def parse_repository(name: str) -> Tuple[str, Optional[str]]:
     """Parse repository image name from tag or digest
@@ -37,8 +43,7 @@ def decode_header(value: Optional[str]) -> Dict[str, Any]:
         return {}
 
     value = base64.b64decode(value)
-    text = value.decode("utf-8")
-    return json.loads(text)
+    return json.loads(value)
 
 
 def prepare_timestamp(value: Union[datetime, int, None]) -> Optional[int]:
@@ -69,15 +74,16 @@ def frames(response: Response) -> Iterator[bytes]:
 
     The stdout and stderr frames are undifferentiated as they are returned.
     """
-    length = len(response.content)
+    content = response.content
+    length = len(content)
     index = 0
     while length - index > 8:
-        header = response.content[index : index + 8]
-        _, frame_length = struct.unpack_from(">BxxxL", header)
+        # Unpack header in place rather than slicing a copy of it
+        _, frame_length = struct.unpack_from(">BxxxL", content, index)
         frame_begin = index + 8
         frame_end = frame_begin + frame_length
         index = frame_end
-        yield response.content[frame_begin:frame_end]
+        yield content[frame_begin:frame_end]
 
 
 def stream_frames(
@@ -113,6 +119,6 @@ def stream_helper(
     """Helper to stream results and optionally decode to json"""
     for value in response.iter_lines():
         if decode_to_json:
-            yield json.loads(value)
+            yield json_loads(value)
         else:
             yield value
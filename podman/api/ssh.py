@@ -80,14 +80,17 @@ class SSHSocket(socket.socket):
             stdin=subprocess.PIPE,
         )
 
+        # Poll quickly at first, the forward is usually ready shortly after the handshake
         expiration = time.monotonic() + 300
+        delay = 0.01
         while not self.local_sock.exists():
             if time.monotonic() > expiration:
                 cmd = " ".join(command)
                 raise subprocess.TimeoutExpired(cmd, expiration)
 
             logger.debug("Waiting on %s", self.local_sock)
-            time.sleep(0.2)
+            time.sleep(delay)
+            delay = min(delay * 2, 0.2)
 
         super().connect(str(self.local_sock))
 
@@ -3,11 +3,8 @@
 import json
 import logging
 import shlex
-from contextlib import suppress
 from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
-import requests
-
 from podman import api
 from podman.api.output_utils import demux_output
 from podman.domain.images import Image
@@ -21,18 +18,24 @@ logger = logging.getLogger("podman.containers")
 class Container(PodmanResource):
     """Details and configuration for a container managed by the Podman service."""
 
+    _cached_properties = ("image",)
+
     @property
     def name(self):
         """str: Returns container's name."""
-        with suppress(KeyError):
+        try:
             if 'Name' in self.attrs:
                 return self.attrs["Name"].lstrip("/")
             return self.attrs["Names"][0].lstrip("/")
-        return None
+        except KeyError:
+            return None
 
-    @property
+    @api.cached_property
     def image(self):
-        """podman.domain.images.Image: Returns Image object used to create Container."""
+        """podman.domain.images.Image: Returns Image object used to create Container.
+
+        The image is fetched from the service on first access and reused until reload().
+        """
         if "Image" in self.attrs:
             image_id = self.attrs["Image"]
 
@@ -43,28 +46,32 @@ class Container(PodmanResource):
     def labels(self):
         """dict[str, str]: Returns labels associated with container."""
         labels = None
-        with suppress(KeyError):
+        try:
             # Container created from ``list()`` operation
             if "Labels" in self.attrs:
                 labels = self.attrs["Labels"]
             # Container created from ``get()`` operation
             else:
                 labels = self.attrs["Config"].get("Labels", {})
+        except KeyError:
+            pass
         return labels or {}
 
     @property
     def status(self):
         """Literal["running", "stopped", "exited", "unknown"]: Returns status of container."""
-        with suppress(KeyError):
+        try:
             return self.attrs["State"]["Status"]
-        return "unknown"
+        except KeyError:
+            return "unknown"
 
     @property
     def ports(self):
         """dict[str, int]: Return ports exposed by container."""
-        with suppress(KeyError):
+        try:
             return self.attrs["NetworkSettings"]["Ports"]
-        return {}
+        except KeyError:
+            return {}
 
     def attach(self, **kwargs) -> Union[str, Iterator[str]]:
         """Attach to container's tty.
@@ -439,7 +446,7 @@ class Container(PodmanResource):
         if stream:
             return api.stream_helper(response, decode_to_json=decode)
 
-        return json.loads(response.content) if decode else response.content
+        return api.json_loads(response.content) if decode else response.content
 
     def stop(self, **kwargs) -> None:
         """Stop container.
@@ -458,10 +465,11 @@ class Container(PodmanResource):
         response = self.client.post(f"/containers/{self.id}/stop", params=params, **post_kwargs)
         response.raise_for_status()
 
-        if response.status_code == requests.codes.no_content:
+        status_code = response.status_code
+        if status_code == api.HTTP_NO_CONTENT:
             return
 
-        if response.status_code == requests.codes.not_modified:
+        if status_code == api.HTTP_NOT_MODIFIED:
             if kwargs.get("ignore", False):
                 return
 
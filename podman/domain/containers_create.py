@@ -1,10 +1,8 @@
 """Mixin to provide Container create() method."""
 
 # pylint: disable=line-too-long
-import copy
 import logging
 import re
-from contextlib import suppress
 from typing import Any, Dict, List, MutableMapping, Union
 
 from podman import api
@@ -16,6 +14,24 @@ from podman.errors import ImageNotFound
 
 logger = logging.getLogger("podman.containers")
 
+# These keywords are not supported for various reasons.
+_UNSUPPORTED_KEYS = frozenset(
+    (
+        "blkio_weight",
+        "blkio_weight_device",  # FIXME In addition to device Major/Minor include path
+        "device_cgroup_rules",  # FIXME Where to map for Podman API?
+        "device_read_bps",  # FIXME In addition to device Major/Minor include path
+        "device_read_iops",  # FIXME In addition to device Major/Minor include path
+        "device_requests",  # FIXME In addition to device Major/Minor include path
+        "device_write_bps",  # FIXME In addition to device Major/Minor include path
+        "device_write_iops",  # FIXME In addition to device Major/Minor include path
+        "domainname",
+        "network_disabled",  # FIXME Where to map for Podman API?
+        "storage_opt",  # FIXME Where to map for Podman API?
+        "tmpfs",  # FIXME Where to map for Podman API?
+    )
+)
+
 NAMED_VOLUME_PATTERN = re.compile(r'[a-zA-Z0-9][a-zA-Z0-9_.-]*')
 
 
@@ -350,9 +366,7 @@ class CreateMixin:  # pylint: disable=too-few-public-methods
         payload = self._render_payload(payload)
         payload = api.prepare_body(payload)
 
-        response = self.client.post(
-            "/containers/create", headers={"content-type": "application/json"}, data=payload
-        )
+        response = self.client.post("/containers/create", headers=api.JSON_HEADERS, data=payload)
         response.raise_for_status(not_found=ImageNotFound)
 
         container_id = response.json()["Id"]
@@ -361,9 +375,11 @@ class CreateMixin:  # pylint: disable=too-few-public-methods
 
     # pylint: disable=too-many-locals,too-many-statements,too-many-branches
     @staticmethod
-    def _render_payload(kwargs: MutableMapping[str, Any]) -> Dict[str, Any]:
-        """Map create/run kwargs into body parameters."""
-        args = copy.copy(kwargs)
+    def _render_payload(args: MutableMapping[str, Any]) -> Dict[str, Any]:
+        """Map create/run kwargs into body parameters.
+
+        Keywords are popped from args as they are mapped, callers pass a mapping they own.
+        """
 
         if "links" in args:
             if len(args["links"]) > 0:
@@ -383,35 +399,15 @@ class CreateMixin:  # pylint: disable=too-few-public-methods
             "detach",  # used by caller
             "volume_driver",
         ):
-            with suppress(KeyError):
-                del args[key]
-
-        # These keywords are not supported for various reasons.
-        unsupported_keys = set(args.keys()).intersection(
-            (
-                "blkio_weight",
-                "blkio_weight_device",  # FIXME In addition to device Major/Minor include path
-                "device_cgroup_rules",  # FIXME Where to map for Podman API?
-                "device_read_bps",  # FIXME In addition to device Major/Minor include path
-                "device_read_iops",  # FIXME In addition to device Major/Minor include path
-                "device_requests",  # FIXME In addition to device Major/Minor include path
-                "device_write_bps",  # FIXME In addition to device Major/Minor include path
-                "device_write_iops",  # FIXME In addition to device Major/Minor include path
-                "domainname",
-                "network_disabled",  # FIXME Where to map for Podman API?
-                "storage_opt",  # FIXME Where to map for Podman API?
-                "tmpfs",  # FIXME Where to map for Podman API?
-            )
-        )
+            args.pop(key, None)
+
+        unsupported_keys = args.keys() & _UNSUPPORTED_KEYS
         if len(unsupported_keys) > 0:
             raise TypeError(
                 f"""Keyword(s) '{" ,".join(unsupported_keys)}' are"""
                 f""" currently not supported by Podman API."""
             )
 
-        def pop(k):
-            return args.pop(k, None)
-
         def to_bytes(size: Union[int, str, None]) -> Union[int, None]:
             """
             Converts str or int to bytes.
@@ -451,86 +447,89 @@ class CreateMixin:  # pylint: disable=too-few-public-methods
 
         # Transform keywords into parameters
         params = {
-            "annotations": pop("annotations"),  # TODO document, podman only
-            "apparmor_profile": pop("apparmor_profile"),  # TODO document, podman only
-            "cap_add": pop("cap_add"),
-            "cap_drop": pop("cap_drop"),
-            "cgroup_parent": pop("cgroup_parent"),
-            "cgroups_mode": pop("cgroups_mode"),  # TODO document, podman only
-            "cni_networks": [pop("network")],
+            "annotations": args.pop("annotations", None),  # TODO document, podman only
+            "apparmor_profile": args.pop("apparmor_profile", None),  # TODO document, podman only
+            "cap_add": args.pop("cap_add", None),
+            "cap_drop": args.pop("cap_drop", None),
+            "cgroup_parent": args.pop("cgroup_parent", None),
+            "cgroups_mode": args.pop("cgroups_mode", None),  # TODO document, podman only
+            "cni_networks": [args.pop("network", None)],
             "command": args.pop("command", args.pop("cmd", None)),
-            "conmon_pid_file": pop("conmon_pid_file"),  # TODO document, podman only
-            "containerCreateCommand": pop("containerCreateCommand"),  # TODO document, podman only
+            "conmon_pid_file": args.pop("conmon_pid_file", None),  # TODO document, podman only
+            # TODO document, podman only
+            "containerCreateCommand": args.pop("containerCreateCommand", None),
             "devices": [],
-            "dns_option": pop("dns_opt"),
-            "dns_search": pop("dns_search"),
-            "dns_server": pop("dns"),
-            "entrypoint": pop("entrypoint"),
-            "env": pop("environment"),
-            "env_host": pop("env_host"),  # TODO document, podman only
+            "dns_option": args.pop("dns_opt", None),
+            "dns_search": args.pop("dns_search", None),
+            "dns_server": args.pop("dns", None),
+            "entrypoint": args.pop("entrypoint", None),
+            "env": args.pop("environment", None),
+            "env_host": args.pop("env_host", None),  # TODO document, podman only
             "expose": {},
-            "groups": pop("group_add"),
-            "healthconfig": pop("healthcheck"),
-            "health_check_on_failure_action": pop("health_check_on_failure_action"),
+            "groups": args.pop("group_add", None),
+            "healthconfig": args.pop("healthcheck", None),
+            "health_check_on_failure_action": args.pop("health_check_on_failure_action", None),
             "hostadd": [],
-            "hostname": pop("hostname"),
-            "httpproxy": pop("use_config_proxy"),
-            "idmappings": pop("idmappings"),  # TODO document, podman only
-            "image": pop("image"),
-            "image_volume_mode": pop("image_volume_mode"),  # TODO document, podman only
-            "image_volumes": pop("image_volumes"),  # TODO document, podman only
-            "init": pop("init"),
-            "init_path": pop("init_path"),
-            "isolation": pop("isolation"),
-            "labels": pop("labels"),
+            "hostname": args.pop("hostname", None),
+            "httpproxy": args.pop("use_config_proxy", None),
+            "idmappings": args.pop("idmappings", None),  # TODO document, podman only
+            "image": args.pop("image", None),
+            "image_volume_mode": args.pop("image_volume_mode", None),  # TODO document, podman only
+            "image_volumes": args.pop("image_volumes", None),  # TODO document, podman only
+            "init": args.pop("init", None),
+            "init_path": args.pop("init_path", None),
+            "isolation": args.pop("isolation", None),
+            "labels": args.pop("labels", None),
             "log_configuration": {},
-            "lxc_config": pop("lxc_config"),
-            "mask": pop("masked_paths"),
+            "lxc_config": args.pop("lxc_config", None),
+            "mask": args.pop("masked_paths", None),
             "mounts": [],
-            "name": pop("name"),
-            "namespace": pop("namespace"),  # TODO What is this for?
-            "network_options": pop("network_options"),  # TODO document, podman only
-            "networks": pop("networks"),
-            "no_new_privileges": pop("no_new_privileges"),  # TODO document, podman only
-            "oci_runtime": pop("runtime"),
-            "oom_score_adj": pop("oom_score_adj"),
-            "overlay_volumes": pop("overlay_volumes"),  # TODO document, podman only
+            "name": args.pop("name", None),
+            "namespace": args.pop("namespace", None),  # TODO What is this for?
+            "network_options": args.pop("network_options", None),  # TODO document, podman only
+            "networks": args.pop("networks", None),
+            "no_new_privileges": args.pop("no_new_privileges", None),  # TODO document, podman only
+            "oci_runtime": args.pop("runtime", None),
+            "oom_score_adj": args.pop("oom_score_adj", None),
+            "overlay_volumes": args.pop("overlay_volumes", None),  # TODO document, podman only
             "portmappings": [],
-            "privileged": pop("privileged"),
-            "procfs_opts": pop("procfs_opts"),  # TODO document, podman only
-            "publish_image_ports": pop("publish_all_ports"),
+            "privileged": args.pop("privileged", None),
+            "procfs_opts": args.pop("procfs_opts", None),  # TODO document, podman only
+            "publish_image_ports": args.pop("publish_all_ports", None),
             "r_limits": [],
-            "raw_image_name": pop("raw_image_name"),  # TODO document, podman only
-            "read_only_filesystem": pop("read_only"),
-            "read_write_tmpfs": pop("read_write_tmpfs"),
+            "raw_image_name": args.pop("raw_image_name", None),  # TODO document, podman only
+            "read_only_filesystem": args.pop("read_only", None),
+            "read_write_tmpfs": args.pop("read_write_tmpfs", None),
             "remove": args.pop("remove", args.pop("auto_remove", None)),
             "resource_limits": {},
-            "rootfs": pop("rootfs"),
-            "rootfs_propagation": pop("rootfs_propagation"),
-            "sdnotifyMode": pop("sdnotifyMode"),  # TODO document, podman only
-            "seccomp_policy": pop("seccomp_policy"),  # TODO document, podman only
-            "seccomp_profile_path": pop("seccomp_profile_path"),  # TODO document, podman only
+            "rootfs": args.pop("rootfs", None),
+            "rootfs_propagation": args.pop("rootfs_propagation", None),
+            "sdnotifyMode": args.pop("sdnotifyMode", None),  # TODO document, podman only
+            "seccomp_policy": args.pop("seccomp_policy", None),  # TODO document, podman only
+            # TODO document, podman only
+            "seccomp_profile_path": args.pop("seccomp_profile_path", None),
             "secrets": [],  # TODO document, podman only
-            "selinux_opts": pop("security_opt"),
-            "shm_size": to_bytes(pop("shm_size")),
-            "static_mac": pop("mac_address"),
-            "stdin": pop("stdin_open"),
-            "stop_signal": pop("stop_signal"),
-            "stop_timeout": pop("stop_timeout"),  # TODO document, podman only
-            "sysctl": pop("sysctls"),
-            "systemd": pop("systemd"),  # TODO document, podman only
-            "terminal": pop("tty"),
-            "timezone": pop("timezone"),
-            "umask": pop("umask"),  # TODO document, podman only
-            "unified": pop("unified"),  # TODO document, podman only
-            "unmask": pop("unmasked_paths"),  # TODO document, podman only
-            "use_image_hosts": pop("use_image_hosts"),  # TODO document, podman only
-            "use_image_resolve_conf": pop("use_image_resolve_conf"),  # TODO document, podman only
-            "user": pop("user"),
-            "version": pop("version"),
+            "selinux_opts": args.pop("security_opt", None),
+            "shm_size": to_bytes(args.pop("shm_size", None)),
+            "static_mac": args.pop("mac_address", None),
+            "stdin": args.pop("stdin_open", None),
+            "stop_signal": args.pop("stop_signal", None),
+            "stop_timeout": args.pop("stop_timeout", None),  # TODO document, podman only
+            "sysctl": args.pop("sysctls", None),
+            "systemd": args.pop("systemd", None),  # TODO document, podman only
+            "terminal": args.pop("tty", None),
+            "timezone": args.pop("timezone", None),
+            "umask": args.pop("umask", None),  # TODO document, podman only
+            "unified": args.pop("unified", None),  # TODO document, podman only
+            "unmask": args.pop("unmasked_paths", None),  # TODO document, podman only
+            "use_image_hosts": args.pop("use_image_hosts", None),  # TODO document, podman only
+            # TODO document, podman only
+            "use_image_resolve_conf": args.pop("use_image_resolve_conf", None),
+            "user": args.pop("user", None),
+            "version": args.pop("version", None),
             "volumes": [],
-            "volumes_from": pop("volumes_from"),
-            "work_dir": pop("workdir") or pop("working_dir"),
+            "volumes_from": args.pop("volumes_from", None),
+            "work_dir": args.pop("workdir", None) or args.pop("working_dir", None),
         }
 
         for device in args.pop("devices", []):
@@ -1,7 +1,6 @@
 """PodmanResource manager subclassed for Containers."""
 
 import logging
-import urllib
 from typing import Any, Dict, List, Mapping, Union
 
 from podman import api
@@ -39,8 +38,7 @@ class ContainersManager(RunMixin, CreateMixin, Manager):
             NotFound: when Container does not exist
             APIError: when an error return by service
         """
-        container_id = urllib.parse.quote_plus(key)
-        response = self.client.get(f"/containers/{container_id}/json")
+        response = self.client.get(f"/containers/{api.quote_name(key)}/json")
         response.raise_for_status()
         return self.prepare_model(attrs=response.json())
 
@@ -11,6 +11,9 @@ from podman.errors import ContainerError, ImageNotFound
 
 logger = logging.getLogger("podman.containers")
 
+# Log drivers the service can read back through the logs endpoint
+_READABLE_LOG_DRIVERS = frozenset(("json-file", "journald", "k8s-file"))
+
 
 class RunMixin:  # pylint: disable=too-few-public-methods
     """Class providing run() method for ContainersManager."""
@@ -66,7 +69,6 @@ class RunMixin:  # pylint: disable=too-few-public-methods
             container = self.create(image=image, command=command, **kwargs)
 
         container.start()
-        container.reload()
 
         def remove_container(container_object: Container) -> None:
             """
@@ -78,16 +80,19 @@ class RunMixin:  # pylint: disable=too-few-public-methods
             container_object.remove()  # Remove the container
 
         if kwargs.get("detach", False):
+            container.reload()
             if remove:
                 # Start a background thread to remove the container after finishing
                 threading.Thread(target=remove_container, args=(container,)).start()
             return container
 
+        # create() returned the inspected container, the log driver does not change on start
+        log_type = None
         with suppress(KeyError):
             log_type = container.attrs["HostConfig"]["LogConfig"]["Type"]
 
         log_iter = None
-        if log_type in ("json-file", "journald"):
+        if log_type in _READABLE_LOG_DRIVERS:
             log_iter = container.logs(stdout=stdout, stderr=stderr, stream=True, follow=True)
 
         exit_status = container.wait()
@@ -1,6 +1,5 @@
 """Model and Manager for Event resources."""
 
-import json
 import logging
 from datetime import datetime
 from typing import Any, Dict, Optional, Union, Iterator
@@ -53,6 +52,6 @@ class EventsManager:  # pylint: disable=too-few-public-methods
 
         for item in response.iter_lines():
             if decode:
-                yield json.loads(item)
+                yield api.json_loads(item)
             else:
                 yield item
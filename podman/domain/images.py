@@ -15,6 +15,8 @@ logger = logging.getLogger("podman.images")
 class Image(PodmanResource):
     """Details and configuration for an Image managed by the Podman service."""
 
+    _cached_properties = ("tags",)
+
     def __repr__(self) -> str:
         return f"""<{self.__class__.__name__}: '{"', '".join(self.tags)}'>"""
 
@@ -27,9 +29,9 @@ class Image(PodmanResource):
 
         return image_labels
 
-    @property
+    @api.cached_property
     def tags(self):
-        """list[str]: Return tags from Image."""
+        """list[str]: Return tags from Image, without the "<none>:<none>" placeholder."""
         repo_tags = self.attrs.get("RepoTags")
         if repo_tags is None or len(repo_tags) == 0:
             return []
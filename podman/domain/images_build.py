@@ -125,7 +125,7 @@ class BuildMixin:
         marker = re.compile(r"(^[0-9a-f]+)\n$")
         report_stream, stream = itertools.tee(response.iter_lines())
         for line in stream:
-            result = json.loads(line)
+            result = api.json_loads(line)
             if "error" in result:
                 raise BuildError(result["error"], report_stream)
             if "stream" in result:
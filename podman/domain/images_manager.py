@@ -4,10 +4,7 @@ import io
 import json
 import logging
 import os
-import urllib.parse
 from typing import Any, Dict, Iterator, List, Mapping, Optional, Union, Generator
-from pathlib import Path
-import requests
 
 from podman import api
 from podman.api import Literal
@@ -42,8 +39,7 @@ class ImagesManager(BuildMixin, Manager):
 
     def exists(self, key: str) -> bool:
         """Return true when image exists."""
-        key = urllib.parse.quote_plus(key)
-        response = self.client.get(f"/images/{key}/exists")
+        response = self.client.get(f"/images/{api.quote_name(key)}/exists")
         return response.ok
 
     def list(self, **kwargs) -> List[Image]:
@@ -70,7 +66,7 @@ class ImagesManager(BuildMixin, Manager):
             "filters": api.prepare_filters(filters=filters),
         }
         response = self.client.get("/images/json", params=params)
-        if response.status_code == requests.codes.not_found:
+        if response.status_code == api.HTTP_NOT_FOUND:
             return []
         response.raise_for_status()
 
@@ -87,8 +83,7 @@ class ImagesManager(BuildMixin, Manager):
             ImageNotFound: when image does not exist
             APIError: when service returns an error
         """
-        name = urllib.parse.quote_plus(name)
-        response = self.client.get(f"/images/{name}/json")
+        response = self.client.get(f"/images/{api.quote_name(name)}/json")
         response.raise_for_status(not_found=ImageNotFound)
 
         return self.prepare_model(response.json())
@@ -144,16 +139,13 @@ class ImagesManager(BuildMixin, Manager):
                 "Only one parameter should be set from 'data' and 'file_path' parameters."
             )
 
-        post_data = data
-        if file_path:
-            # Convert to Path if file_path is a string
-            file_path_object = Path(file_path)
-            post_data = file_path_object.read_bytes()  # Read the tarball file as bytes
-
         # Make the client request before entering the generator
-        response = self.client.post(
-            "/images/load", data=post_data, headers={"Content-type": "application/x-tar"}
-        )
+        if file_path:
+            # Stream the tarball from disk, rather than reading it all into memory
+            with open(file_path, "rb") as post_data:
+                response = self.client.post("/images/load", data=post_data, headers=api.TAR_HEADERS)
+        else:
+            response = self.client.post("/images/load", data=data, headers=api.TAR_HEADERS)
         response.raise_for_status()  # Catch any errors before proceeding
 
         def _generator(body: dict) -> Generator[bytes, None, None]:
@@ -257,12 +249,7 @@ class ImagesManager(BuildMixin, Manager):
         Raises:
             APIError: when service returns an error
         """
-        auth_config: Optional[Dict[str, str]] = kwargs.get("auth_config")
-
-        headers = {
-            # A base64url-encoded auth configuration
-            "X-Registry-Auth": encode_auth_header(auth_config) if auth_config else ""
-        }
+        headers = self._registry_auth_headers(kwargs.get("auth_config"))
 
         params = {
             "destination": kwargs.get("destination"),
@@ -271,8 +258,9 @@ class ImagesManager(BuildMixin, Manager):
         }
 
         name = f'{repository}:{tag}' if tag else repository
-        name = urllib.parse.quote_plus(name)
-        response = self.client.post(f"/images/{name}/push", params=params, headers=headers)
+        response = self.client.post(
+            f"/images/{api.quote_name(name)}/push", params=params, headers=headers
+        )
         response.raise_for_status(not_found=ImageNotFound)
 
         tag_count = 0 if tag is None else 1
@@ -297,6 +285,12 @@ class ImagesManager(BuildMixin, Manager):
                 buffer.write(json.dumps(entry) + "\n")
             return buffer.getvalue()
 
+    @staticmethod
+    def _registry_auth_headers(auth_config: Optional[Dict[str, str]]) -> Dict[str, str]:
+        """Return the X-Registry-Auth header shared by pull() and push()."""
+        # A base64url-encoded auth configuration
+        return {"X-Registry-Auth": encode_auth_header(auth_config) if auth_config else ""}
+
     @staticmethod
     def _push_helper(
         decode: bool, body: List[Dict[str, Any]]
@@ -345,12 +339,7 @@ class ImagesManager(BuildMixin, Manager):
             else:
                 tag = "latest"
 
-        auth_config: Optional[Dict[str, str]] = kwargs.get("auth_config")
-
-        headers = {
-            # A base64url-encoded auth configuration
-            "X-Registry-Auth": encode_auth_header(auth_config) if auth_config else ""
-        }
+        headers = self._registry_auth_headers(kwargs.get("auth_config"))
 
         params = {
             "reference": repository,
@@ -399,7 +388,7 @@ class ImagesManager(BuildMixin, Manager):
             )
             with progress:
                 for line in response.iter_lines():
-                    decoded_line = json.loads(line.decode('utf-8'))
+                    decoded_line = api.json_loads(line)
                     self.__show_progress_bar(decoded_line, progress, tasks)
             return None
 
@@ -407,7 +396,7 @@ class ImagesManager(BuildMixin, Manager):
             return response.iter_lines()
 
         for item in response.iter_lines():
-            obj = json.loads(item)
+            obj = api.json_loads(item)
             if all_tags and "images" in obj:
                 images: List[Image] = []
                 for name in obj["images"]:
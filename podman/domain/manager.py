@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from collections import abc
-from typing import Any, List, Mapping, Optional, TypeVar, Union
+from typing import Any, List, Mapping, Optional, Tuple, TypeVar, Union
 
 from podman.api.client import APIClient
 
@@ -17,6 +17,9 @@ class PodmanResource(ABC):
         attrs: Mapping of attributes for resource from Podman service
     """
 
+    # Names of cached_property values derived from attrs, dropped when reload() refreshes attrs
+    _cached_properties: Tuple[str, ...] = ()
+
     def __init__(
         self,
         attrs: Optional[Mapping[str, Any]] = None,
@@ -70,6 +73,8 @@ class PodmanResource(ABC):
         """Refresh this object's data from the service."""
         latest = self.manager.get(self.id)
         self.attrs = latest.attrs
+        for name in self._cached_properties:
+            self.__dict__.pop(name, None)
 
 
 class Manager(ABC):
@@ -114,20 +119,22 @@ class Manager(ABC):
     def prepare_model(self, attrs: Union[PodmanResource, Mapping[str, Any]]) -> PodmanResourceType:
         """Create a model from a set of attributes."""
 
-        # Refresh existing PodmanResource.
-        if isinstance(attrs, PodmanResource):
-            attrs.client = self.client
-            attrs.podman_client = self.podman_client
-            attrs.collection = self
-            return attrs
+        # Decoded JSON is always a plain dict, test for it before the ABC isinstance() checks
+        if not isinstance(attrs, dict):
+            # Refresh existing PodmanResource.
+            if isinstance(attrs, PodmanResource):
+                attrs.client = self.client
+                attrs.podman_client = self.podman_client
+                attrs.collection = self
+                return attrs
+
+            if not isinstance(attrs, abc.Mapping):
+                # pylint: disable=broad-exception-raised
+                raise Exception(f"Can't create {self.resource.__name__} from {attrs}")
 
         # Instantiate new PodmanResource from Mapping[str, Any]
-        if isinstance(attrs, abc.Mapping):
-            # TODO Determine why pylint is reporting typing.Type not callable
-            # pylint: disable=not-callable
-            return self.resource(
-                attrs=attrs, client=self.client, podman_client=self.podman_client, collection=self
-            )
-
-        # pylint: disable=broad-exception-raised
-        raise Exception(f"Can't create {self.resource.__name__} from {attrs}")
+        # TODO Determine why pylint is reporting typing.Type not callable
+        # pylint: disable=not-callable
+        return self.resource(
+            attrs=attrs, client=self.client, podman_client=self.podman_client, collection=self
+        )
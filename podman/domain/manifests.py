@@ -1,7 +1,6 @@
 """Model and Manager for Manifest resources."""
 
 import logging
-import urllib.parse
 from contextlib import suppress
 from typing import Any, Dict, List, Optional, Union
 
@@ -34,7 +33,7 @@ class Manifest(PodmanResource):
     @property
     def quoted_name(self):
         """str: name quoted as path parameter."""
-        return urllib.parse.quote_plus(self.name)
+        return api.quote_name(self.name)
 
     @property
     def names(self):
@@ -176,8 +175,7 @@ class ManifestsManager(Manager):
         if all is not None:
             params["all"] = all
 
-        name_quoted = urllib.parse.quote_plus(name)
-        response = self.client.post(f"/manifests/{name_quoted}", params=params)
+        response = self.client.post(f"/manifests/{api.quote_name(name)}", params=params)
         response.raise_for_status(not_found=ImageNotFound)
 
         body = response.json()
@@ -189,8 +187,7 @@ class ManifestsManager(Manager):
         return manifest
 
     def exists(self, key: str) -> bool:
-        key = urllib.parse.quote_plus(key)
-        response = self.client.get(f"/manifests/{key}/exists")
+        response = self.client.get(f"/manifests/{api.quote_name(key)}/exists")
         return response.ok
 
     def get(self, key: str) -> Manifest:
@@ -206,8 +203,7 @@ class ManifestsManager(Manager):
             NotFound: when manifest could not be found
             APIError: when service reports an error
         """
-        quoted_key = urllib.parse.quote_plus(key)
-        response = self.client.get(f"/manifests/{quoted_key}/json")
+        response = self.client.get(f"/manifests/{api.quote_name(key)}/json")
         response.raise_for_status()
 
         body = response.json()
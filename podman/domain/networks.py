@@ -13,6 +13,7 @@ import logging
 from contextlib import suppress
 from typing import Optional, Union
 
+from podman import api
 from podman.domain.containers import Container
 from podman.domain.containers_manager import ContainersManager
 from podman.domain.manager import PodmanResource
@@ -110,7 +111,7 @@ class Network(PodmanResource):
         response = self.client.post(
             f"/networks/{self.name}/connect",
             data=json.dumps(data),
-            headers={"Content-type": "application/json"},
+            headers=api.JSON_HEADERS,
         )
         response.raise_for_status()
 
@@ -70,7 +70,7 @@ class NetworksManager(Manager):
         response = self.client.post(
             "/networks/create",
             data=http_utils.prepare_body(data),
-            headers={"Content-Type": "application/json"},
+            headers=api.JSON_HEADERS,
         )
         response.raise_for_status()
         return self.prepare_model(attrs=response.json())
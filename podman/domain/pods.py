@@ -105,7 +105,7 @@ class Pod(PodmanResource):
         response = self.client.get(f"/pods/{self.id}/top", params=params)
         response.raise_for_status()
 
-        if len(response.text) == 0:
+        if len(response.content) == 0:
             return {"Processes": [], "Titles": []}
         return response.json()
 
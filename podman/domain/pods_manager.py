@@ -161,4 +161,4 @@ class PodsManager(Manager):
         if stream:
             return api.stream_helper(response, decode_to_json=decode)
 
-        return json.loads(response.content) if decode else response.content
+        return api.json_loads(response.content) if decode else response.content
@@ -57,20 +57,18 @@ class RegistryData(PodmanResource):
             InvalidArgument: when platform value is not valid
             APIError: when service reports an error
         """
-        invalid_platform = InvalidArgument(f"'{platform}' is not a valid platform descriptor.")
-
         if platform is None:
             platform = {}
 
         if isinstance(platform, dict):
             if not {"os", "architecture"} <= platform.keys():
-                version = self.client.version()
+                version = self.client.server_version
                 platform["os"] = platform.get("os", version["Os"])
                 platform["architecture"] = platform.get("architecture", version["Arch"])
         elif isinstance(platform, str):
             elements = platform.split("/")
             if 1 < len(elements) > 3:
-                raise invalid_platform
+                raise self._invalid_platform(platform)
 
             platform = {"os": elements[0]}
             if len(elements) > 2:
@@ -78,10 +76,15 @@ class RegistryData(PodmanResource):
             if len(elements) > 1:
                 platform["architecture"] = elements[1]
         else:
-            raise invalid_platform
+            raise self._invalid_platform(platform)
 
         return (
             # Variant not carried in libpod attrs
             platform["os"] == self.attrs["Os"]
             and platform["architecture"] == self.attrs["Architecture"]
         )
+
+    @staticmethod
+    def _invalid_platform(platform: Any) -> InvalidArgument:
+        """Returns the error for a platform descriptor has_platform() cannot parse."""
+        return InvalidArgument(f"'{platform}' is not a valid platform descriptor.")
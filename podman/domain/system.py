@@ -78,7 +78,7 @@ class SystemManager:
         payload = api.prepare_body(payload)
         response = self.client.post(
             path="/auth",
-            headers={"Content-type": "application/json"},
+            headers=api.JSON_HEADERS,
             data=payload,
             compatible=True,
             verify=tls_verify,  # Pass tls_verify to the client
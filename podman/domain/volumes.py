@@ -3,8 +3,6 @@
 import logging
 from typing import Any, Dict, List, Optional, Union
 
-import requests
-
 from podman import api
 from podman.api import Literal
 from podman.domain.manager import Manager, PodmanResource
@@ -68,7 +66,7 @@ class VolumesManager(Manager):
         response = self.client.post(
             "/volumes/create",
             data=api.prepare_body(data),
-            headers={"Content-Type": "application/json"},
+            headers=api.JSON_HEADERS,
         )
         response.raise_for_status()
         return self.prepare_model(attrs=response.json())
@@ -105,11 +103,11 @@ class VolumesManager(Manager):
         filters = api.prepare_filters(kwargs.get("filters"))
         response = self.client.get("/volumes/json", params={"filters": filters})
 
-        if response.status_code == requests.codes.not_found:
+        if response.status_code == api.HTTP_NOT_FOUND:
             return []
         response.raise_for_status()
 
-        return [self.prepare_model(i) for i in response.json()]
+        return list(map(self.prepare_model, response.json()))
 
     def prune(
         self,
@@ -124,11 +122,9 @@ class VolumesManager(Manager):
             APIError: when service reports error
         """
         response = self.client.post("/volumes/prune")
-        data = response.json()
         response.raise_for_status()
+        data = response.json()
 
-        volumes: List[str] = []
-        space_reclaimed = 0
         for item in data:
             if "Err" in item:
                 raise APIError(
@@ -136,10 +132,11 @@ class VolumesManager(Manager):
                     response=response,
                     explanation=f"""Failed to prune volume '{item.get("Id")}'""",
                 )
-            volumes.append(item.get("Id"))
-            space_reclaimed += item["Size"]
 
-        return {"VolumesDeleted": volumes, "SpaceReclaimed": space_reclaimed}
+        return {
+            "VolumesDeleted": [item.get("Id") for item in data],
+            "SpaceReclaimed": sum(item["Size"] for item in data),
+        }
 
     def remove(self, name: Union[Volume, str], force: Optional[bool] = None) -> None:
         """Delete a volume.
@@ -1,12 +1,11 @@
 """Podman API errors Package.
 
-Import exceptions from 'importlib' are used to differentiate between APIConnection
-and PodmanClient errors. Therefore, installing both APIConnection and PodmanClient
-is not supported. PodmanClient related errors take precedence over APIConnection ones.
+PodmanClient errors are always imported from the exceptions module and exported here.
 
 ApiConnection and associated classes have been deprecated.
 """
 
+import functools
 import warnings
 from http.client import HTTPException
 
@@ -23,22 +22,28 @@ __all__ = [
     'PodmanError',
 ]
 
-try:
-    from .exceptions import (
-        APIError,
-        BuildError,
-        ContainerError,
-        DockerException,
-        InvalidArgument,
-        NotFound,
-        PodmanError,
+from .exceptions import (
+    APIError,
+    BuildError,
+    ContainerError,
+    DockerException,
+    ImageNotFound,
+    InvalidArgument,
+    NotFound,
+    PodmanError,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _warn_deprecated() -> None:
+    """Warn that APIConnection errors are deprecated, once per process."""
+    warnings.warn(
+        "APIConnection() and supporting classes.", PendingDeprecationWarning, stacklevel=2
     )
-except ImportError:
-    pass
 
 
-class NotFoundError(HTTPException):
-    """HTTP request returned a http.HTTPStatus.NOT_FOUND.
+class _DeprecatedError(HTTPException):
+    """Base class for errors raised by APIConnection.
 
     Deprecated.
     """
@@ -46,19 +51,14 @@ class NotFoundError(HTTPException):
     def __init__(self, message, response=None):
         super().__init__(message)
         self.response = response
-        warnings.warn("APIConnection() and supporting classes.", PendingDeprecationWarning)
-
+        _warn_deprecated()
 
-# If found, use new ImageNotFound otherwise old class
-try:
-    from .exceptions import ImageNotFound
-except ImportError:
 
-    class ImageNotFound(NotFoundError):
-        """HTTP request returned a http.HTTPStatus.NOT_FOUND.
+class NotFoundError(_DeprecatedError):
+    """HTTP request returned a http.HTTPStatus.NOT_FOUND.
 
-        Specialized for Image not found. Deprecated.
-        """
+    Deprecated.
+    """
 
 
 class NetworkNotFound(NotFoundError):
@@ -89,25 +89,15 @@ class ManifestNotFound(NotFoundError):
     """
 
 
-class RequestError(HTTPException):
+class RequestError(_DeprecatedError):
     """Podman service reported issue with the request.
 
     Deprecated.
     """
 
-    def __init__(self, message, response=None):
-        super().__init__(message)
-        self.response = response
-        warnings.warn("APIConnection() and supporting classes.", PendingDeprecationWarning)
-
 
-class InternalServerError(HTTPException):
+class InternalServerError(_DeprecatedError):
     """Podman service reported an internal error.
 
     Deprecated.
     """
-
-    def __init__(self, message, response=None):
-        super().__init__(message)
-        self.response = response
-        warnings.warn("APIConnection() and supporting classes.", PendingDeprecationWarning)
@@ -14,6 +14,17 @@ if TYPE_CHECKING:
 class APIError(HTTPError):
     """Wraps HTTP errors for processing by the API and clients."""
 
+    # response and request are assigned by requests.exceptions.RequestException
+    __slots__ = (
+        "_response",
+        "request",
+        "_explanation",
+        "_message",
+        "_status_code",
+        "_client_error",
+        "_server_error",
+    )
+
     def __init__(
         self,
         message: str,
@@ -32,28 +43,67 @@ class APIError(HTTPError):
         self.explanation = explanation
 
     def __str__(self):
+        # Errors are often rendered more than once (logging, re-raise), format the message once
+        if self._message is not None:
+            return self._message
+
         msg = super().__str__()
 
-        if self.response is not None:
-            msg = self.response.reason
+        if self._response is not None:
+            msg = self._response.reason
 
         if self.is_client_error():
-            msg = f"{self.status_code} Client Error: {msg}"
+            msg = f"{self._status_code} Client Error: {msg}"
 
         elif self.is_server_error():
-            msg = f"{self.status_code} Server Error: {msg}"
+            msg = f"{self._status_code} Server Error: {msg}"
 
-        if self.explanation:
-            msg = f"{msg} ({self.explanation})"
+        if self._explanation:
+            msg = f"{msg} ({self._explanation})"
 
+        self._message = msg
         return msg
 
+    def __reduce__(self):
+        # BaseException.__reduce__ only carries __dict__, add slotted attributes to it
+        state = dict(getattr(self, "__dict__", {}))
+        state.update({k: getattr(self, k) for k in APIError.__slots__})
+        return type(self), self.args, state
+
+    @property
+    def response(self) -> Union[Response, "APIResponse", None]:
+        """HTTP Response from service."""
+        return self._response
+
+    @response.setter
+    def response(self, value: Union[Response, "APIResponse", None]) -> None:
+        self._response = value
+        # Derived from the response on first use, see _categorize()
+        self._status_code = self._client_error = self._server_error = None
+        self._message = None
+
+    @property
+    def explanation(self) -> Optional[str]:
+        """An enhanced or wrapped version of message with additional context."""
+        return self._explanation
+
+    @explanation.setter
+    def explanation(self, value: Optional[str]) -> None:
+        self._explanation = value
+        self._message = None
+
+    def _categorize(self) -> None:
+        """Categorize the response status once, rather than on every query."""
+        self._status_code = self._response.status_code if self._response is not None else None
+        self._client_error = 400 <= (self._status_code or 0) < 500
+        self._server_error = 500 <= (self._status_code or 0) < 600
+
     @property
     def status_code(self):
         """Optional[int]: HTTP status code from response."""
-        if self.response is not None:
-            return self.response.status_code
-        return None
+        if self._client_error is None:
+            self._categorize()
+        return self._status_code
 
     def is_error(self) -> bool:
         """Returns True when HTTP operation resulted in an error."""
@@ -61,11 +111,15 @@ class APIError(HTTPError):
 
     def is_client_error(self) -> bool:
         """Returns True when request is incorrect."""
-        return 400 <= (self.status_code or 0) < 500
+        if self._client_error is None:
+            self._categorize()
+        return self._client_error
 
     def is_server_error(self) -> bool:
         """Returns True when error occurred in service."""
-        return 500 <= (self.status_code or 0) < 600
+        if self._server_error is None:
+            self._categorize()
+        return self._server_error
 
 
 class NotFound(APIError):
@@ -74,10 +128,14 @@ class NotFound(APIError):
     Named for compatibility.
     """
 
+    __slots__ = ()
+
 
 class ImageNotFound(APIError):
     """Image not found on Podman service."""
 
+    __slots__ = ()
+
 
 class DockerException(Exception):
     """Base class for exception hierarchy.
@@ -85,14 +143,20 @@ class DockerException(Exception):
     Provided for compatibility.
     """
 
+    __slots__ = ()
+
 
 class PodmanError(DockerException):
     """Base class for PodmanPy exceptions."""
 
+    __slots__ = ()
+
 
 class BuildError(PodmanError):
     """Error occurred during build operation."""
 
+    __slots__ = ("msg", "build_log")
+
     def __init__(self, reason: str, build_log: Iterable[str]) -> None:
         """Initialize BuildError.
 
@@ -108,6 +172,8 @@ class BuildError(PodmanError):
 class ContainerError(PodmanError):
     """Represents a container that has exited with a non-zero exit code."""
 
+    __slots__ = ("container", "exit_status", "command", "image", "stderr")
+
     def __init__(
         self,
         container: "Container",
@@ -142,3 +208,5 @@ class ContainerError(PodmanError):
 
 class InvalidArgument(PodmanError):
     """Parameter to method/function was not valid."""
+
+    __slots__ = ()
@@ -1,6 +1,7 @@
 import json
 import pathlib
 import unittest
+import urllib.parse
 from typing import Any, Optional
 from unittest import mock
 from unittest.mock import Mock, mock_open, patch
@@ -164,6 +165,30 @@ class TestUtilsCase(unittest.TestCase):
 
         self.assertDictEqual(payload, actual_dict)
 
+    def test_quote_name(self):
+        self.assertEqual(
+            api.quote_name("quay.io/libpod/alpine:latest"), "quay.io%2Flibpod%2Falpine%3Alatest"
+        )
+        self.assertEqual(api.quote_name("fedora"), "fedora")
+
+    def test_join_path(self):
+        prefix = "/v5.0.0/libpod/"
+        for path in (
+            "containers/json",
+            "images/quay.io%2Flibpod%2Falpine%3Alatest/json",
+            "pods/a.b/top",
+            "a//b",
+            "./info",
+            "a/../b",
+            "x;y",
+            "c:d/e",
+            "",
+        ):
+            with self.subTest(path=path):
+                self.assertEqual(
+                    api.APIClient._join_path(prefix, path), urllib.parse.urljoin(prefix, path)
+                )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -331,6 +331,32 @@ class ContainersTestCase(unittest.TestCase):
         self.assertTrue(post_adapter.called_once)
         self.assertTrue(get_adapter.called_once)
 
+    @requests_mock.Mocker()
+    def test_image(self, mock):
+        adapter = mock.get(
+            tests.LIBPOD_URL + "/images/quay.io%2Ffedora%3Alatest/json",
+            json={"Id": "d2459aad75354ddc9b5b23f863786e279637125af6ba4d4a83f881866b3c903f"},
+        )
+        mock.get(
+            tests.LIBPOD_URL
+            + "/containers/87e1325c82424e49a00abdd4de08009eb76c7de8d228426a9b8af9318ced5ecd/json",
+            json=FIRST_CONTAINER,
+        )
+        manager = ContainersManager(self.client.api)
+        container = manager.prepare_model(attrs=FIRST_CONTAINER)
+
+        self.assertIs(container.image, container.image)
+        self.assertEqual(
+            container.image.id, "d2459aad75354ddc9b5b23f863786e279637125af6ba4d4a83f881866b3c903f"
+        )
+        self.assertEqual(adapter.call_count, 1)
+
+        container.reload()
+        self.assertEqual(
+            container.image.id, "d2459aad75354ddc9b5b23f863786e279637125af6ba4d4a83f881866b3c903f"
+        )
+        self.assertEqual(adapter.call_count, 2)
+
     @requests_mock.Mocker()
     def test_put_archive(self, mock):
         adapter = mock.put(
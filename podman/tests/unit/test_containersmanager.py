@@ -308,7 +308,7 @@ class ContainersManagerTestCase(unittest.TestCase):
             + "/containers/87e1325c82424e49a00abdd4de08009eb76c7de8d228426a9b8af9318ced5ecd/start",
             status_code=204,
         )
-        mock.get(
+        inspect = mock.get(
             tests.LIBPOD_URL
             + "/containers/87e1325c82424e49a00abdd4de08009eb76c7de8d228426a9b8af9318ced5ecd/json",
             json=FIRST_CONTAINER,
@@ -328,6 +328,7 @@ class ContainersManagerTestCase(unittest.TestCase):
                 actual = self.client.containers.run("fedora", "/usr/bin/ls")
                 self.assertIsInstance(actual, bytes)
                 self.assertEqual(actual, b'This is a unittest - line 1This is a unittest - line 2')
+                self.assertEqual(inspect.call_count, 1)
 
             # iter() cannot be reset so subtests used to create new instance
             with self.subTest("Stream results"):
@@ -339,6 +340,34 @@ class ContainersManagerTestCase(unittest.TestCase):
                 self.assertEqual(next(actual), b"This is a unittest - line 1")
                 self.assertEqual(next(actual), b"This is a unittest - line 2")
 
+    @requests_mock.Mocker()
+    def test_run_k8s_file(self, mock):
+        mock.post(
+            tests.LIBPOD_URL + "/containers/create",
+            status_code=201,
+            json={
+                "Id": "87e1325c82424e49a00abdd4de08009eb76c7de8d228426a9b8af9318ced5ecd",
+                "Warnings": [],
+            },
+        )
+        mock.post(
+            tests.LIBPOD_URL
+            + "/containers/87e1325c82424e49a00abdd4de08009eb76c7de8d228426a9b8af9318ced5ecd/start",
+            status_code=204,
+        )
+        mock.get(
+            tests.LIBPOD_URL
+            + "/containers/87e1325c82424e49a00abdd4de08009eb76c7de8d228426a9b8af9318ced5ecd/json",
+            json={**FIRST_CONTAINER, "HostConfig": {"LogConfig": {"Type": "k8s-file"}}},
+        )
+
+        with patch.multiple(Container, logs=DEFAULT, wait=DEFAULT, autospec=True) as mock_container:
+            mock_container["wait"].return_value = 0
+            mock_container["logs"].return_value = iter((b"line 1", b"line 2"))
+
+            actual = self.client.containers.run("fedora", "/usr/bin/ls")
+            self.assertEqual(actual, b"line 1line 2")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,57 @@
+import pickle
+import unittest
+
+import requests
+
+from podman.errors import NotFound
+
+
+class ErrorsTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.response = requests.Response()
+        self.response.status_code = 404
+        self.response.reason = "Not Found"
+        self.response._content = b'{"cause": "no such image"}'
+
+    def test_reassign(self):
+        error = NotFound("no such image", response=self.response)
+        self.assertEqual(str(error), "404 Client Error: Not Found")
+        self.assertTrue(error.is_client_error())
+
+        response = requests.Response()
+        response.status_code = 500
+        response.reason = "Internal Server Error"
+        error.response = response
+        error.explanation = "busybox"
+
+        self.assertEqual(error.status_code, 500)
+        self.assertFalse(error.is_client_error())
+        self.assertTrue(error.is_server_error())
+        self.assertEqual(str(error), "500 Server Error: Internal Server Error (busybox)")
+
+    def test_pickle(self):
+        error = NotFound("no such image", response=self.response, explanation="busybox")
+        error.extra = 1
+
+        actual = pickle.loads(pickle.dumps(error))
+        self.assertIsInstance(actual, NotFound)
+        self.assertEqual(str(actual), "404 Client Error: Not Found (busybox)")
+        self.assertEqual(actual.status_code, 404)
+        self.assertEqual(actual.explanation, "busybox")
+        self.assertEqual(actual.extra, 1)
+
+    @unittest.skipUnless(hasattr(BaseException, "add_note"), "requires Python 3.11")
+    def test_pickle_notes(self):
+        error = NotFound("no such image", response=self.response, explanation="busybox")
+        error.add_note("while pulling busybox")
+
+        actual = pickle.loads(pickle.dumps(error))
+        self.assertEqual(str(actual), "404 Client Error: Not Found (busybox)")
+        self.assertEqual(actual.status_code, 404)
+        self.assertEqual(actual.__notes__, ["while pulling busybox"])
+
+
+if __name__ == '__main__':
+    unittest.main()
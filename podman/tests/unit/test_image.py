@@ -72,6 +72,7 @@ class ImageTestCase(unittest.TestCase):
     def test_reload(self, mock):
         update = FIRST_IMAGE.copy()
         update["Containers"] = 0
+        update["RepoTags"] = ["fedora:latest"]
 
         adapter = mock.get(
             tests.LIBPOD_URL
@@ -86,9 +87,11 @@ class ImageTestCase(unittest.TestCase):
             "326dd9d7add24646a325e8eaa82125294027db2332e49c5828d96312c5d773ab"
         )
         self.assertEqual(image.attrs["Containers"], 2)
+        self.assertEqual(image.tags, ["fedora:latest", "fedora:33"])
 
         image.reload()
         self.assertEqual(image.attrs["Containers"], 0)
+        self.assertEqual(image.tags, ["fedora:latest"])
         self.assertTrue(adapter.call_count, 2)
 
     @requests_mock.Mocker()
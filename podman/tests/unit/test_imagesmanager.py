@@ -1,6 +1,7 @@
+import pathlib
+import tempfile
 import types
 import unittest
-from unittest.mock import mock_open, patch
 
 try:
     # Python >= 3.10
@@ -388,9 +389,11 @@ class ImagesManagerTestCase(unittest.TestCase):
         with self.assertRaises(PodmanError):
             self.client.images.load(data=b'data', file_path=b'file_path')
 
-        # Patch Path.read_bytes to mock the file reading behavior
-        with patch("pathlib.Path.read_bytes", return_value=b"mock tarball data"):
-            mock.post(
+        with tempfile.TemporaryDirectory() as context_dir:
+            tarball = pathlib.Path(context_dir) / "mock_file.tar"
+            tarball.write_bytes(b"mock tarball data")
+
+            adapter = mock.post(
                 tests.LIBPOD_URL + "/images/load",
                 json={"Names": ["quay.io/fedora:latest"]},
             )
@@ -400,8 +403,9 @@ class ImagesManagerTestCase(unittest.TestCase):
             )
 
             # 3a. Test the case where only 'file_path' is provided
-            gntr = self.client.images.load(file_path="mock_file.tar")
+            gntr = self.client.images.load(file_path=str(tarball))
             self.assertIsInstance(gntr, types.GeneratorType)
+            self.assertEqual(adapter.last_request.body.name, str(tarball))
 
             report = list(gntr)
             self.assertEqual(len(report), 1)
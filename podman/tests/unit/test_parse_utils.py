@@ -65,6 +65,14 @@ class ParseUtilsTestCase(unittest.TestCase):
         net = ipaddress.IPv4Network("127.0.0.0/24")
         self.assertEqual(api.prepare_cidr(net), ("127.0.0.0", "////AA=="))
 
+    def test_frames(self):
+        mock_response = mock.Mock(spec=Response)
+        mock_response.content = (
+            b"\x01\x00\x00\x00\x00\x00\x00\x05hello\x02\x00\x00\x00\x00\x00\x00\x05world"
+        )
+
+        self.assertListEqual(list(api.frames(mock_response)), [b"hello", b"world"])
+
     def test_stream_helper(self):
         streamed_results = [b'{"test":"val1"}', b'{"test":"val2"}']
         mock_response = mock.Mock(spec=Response)
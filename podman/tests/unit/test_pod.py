@@ -191,6 +191,20 @@ class PodTestCase(unittest.TestCase):
         self.assertDictEqual(actual, body)
         self.assertTrue(adapter.called_once)
 
+    @requests_mock.Mocker()
+    def test_top_empty(self, mock):
+        adapter = mock.get(
+            tests.LIBPOD_URL + "/pods"
+            "/c8b9f5b17dc1406194010c752fc6dcb330192032e27648db9b14060447ecf3b8/top"
+            "?stream=False",
+            content=b"",
+        )
+
+        pod = Pod(attrs=FIRST_POD, client=self.client.api)
+        actual = pod.top()
+        self.assertDictEqual(actual, {"Processes": [], "Titles": []})
+        self.assertTrue(adapter.called_once)
+
     @requests_mock.Mocker()
     def test_unpause(self, mock):
         adapter = mock.post(
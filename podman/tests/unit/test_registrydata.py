@@ -76,6 +76,20 @@ class RegistryDataTestCase(unittest.TestCase):
 
         self.assertTrue(rd.has_platform({"os": "linux", "architecture": "amd64"}))
 
+    @requests_mock.Mocker()
+    def test_platform_default(self, mock):
+        adapter = mock.get(tests.LIBPOD_URL + "/version", json={"Os": "linux", "Arch": "amd64"})
+        rd = RegistryData(
+            "326dd9d7add24646a325e8eaa82125294027db2332e49c5828d96312c5d773ab",
+            attrs=FIRST_IMAGE,
+            client=self.client.api,
+            collection=ImagesManager(client=self.client.api),
+        )
+
+        self.assertTrue(rd.has_platform(None))
+        self.assertTrue(rd.has_platform({"os": "linux"}))
+        self.assertEqual(adapter.call_count, 1)
+
     def test_platform_404(self):
         rd = RegistryData(
             "326dd9d7add24646a325e8eaa82125294027db2332e49c5828d96312c5d773ab",
@@ -5,7 +5,7 @@ import requests_mock
 
 from podman import PodmanClient, tests
 from podman.domain.volumes import Volume, VolumesManager
-from podman.errors import NotFound
+from podman.errors import APIError, NotFound
 
 FIRST_VOLUME = {
     "CreatedAt": "1985-04-12T23:20:50.52Z",
@@ -97,8 +97,9 @@ class VolumesManagerTestCase(unittest.TestCase):
             status_code=404,
         )
 
-        with self.assertRaises(NotFound):
+        with self.assertRaises(NotFound) as e:
             self.client.volumes.get("dbase")
+        self.assertEqual(e.exception.explanation, "Not Found")
         self.assertTrue(adapter.called_once)
 
     @requests_mock.Mocker()
@@ -122,6 +123,21 @@ class VolumesManagerTestCase(unittest.TestCase):
         self.assertIsInstance(actual, list)
         self.assertEqual(len(actual), 0)
 
+    @requests_mock.Mocker()
+    def test_exists(self, mock):
+        mock.get(
+            tests.LIBPOD_URL + "/volumes/dbase/exists",
+            status_code=requests.codes.no_content,
+        )
+        mock.get(
+            tests.LIBPOD_URL + "/volumes/source/exists",
+            json={"cause": "no such volume", "message": "no such volume", "response": 404},
+            status_code=requests.codes.not_found,
+        )
+
+        self.assertTrue(self.client.volumes.exists("dbase"))
+        self.assertFalse(self.client.volumes.exists("source"))
+
     @requests_mock.Mocker()
     def test_prune(self, mock):
         mock.post(
@@ -137,6 +153,17 @@ class VolumesManagerTestCase(unittest.TestCase):
             actual, {"VolumesDeleted": ["dbase", "source"], "SpaceReclaimed": 2048}
         )
 
+    @requests_mock.Mocker()
+    def test_prune_500(self, mock):
+        mock.post(
+            tests.LIBPOD_URL + "/volumes/prune",
+            text="internal server error",
+            status_code=requests.codes.internal_server_error,
+        )
+
+        with self.assertRaises(APIError):
+            self.client.volumes.prune()
+
 
 if __name__ == '__main__':
     unittest.main()